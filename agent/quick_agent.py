@@ -1,9 +1,11 @@
 # agent/quick_agent.py
 
+import asyncio
+
 from langchain.tools import Tool
 from gradio_client import Client
 
-def test_it():
+async def test_it():
     """
     A simple smoke-test that calls each MCP tool endpoint
     and prints out their JSON responses at a sample location.
@@ -36,19 +38,22 @@ def test_it():
     sample_lat = 55.66
     sample_lon = 12.56
 
-    # 4) Call each tool and print its JSON response
+    # 4) Call the tools concurrently (they are independent), then print each JSON response
+    wind_json, tide_json, spots_json = await asyncio.gather(
+        asyncio.to_thread(tools[0].func, {"lat": sample_lat, "lon": sample_lon, "hours": 5}),
+        asyncio.to_thread(tools[1].func, {"lat": sample_lat, "lon": sample_lon, "hours": 5}),
+        asyncio.to_thread(tools[2].func, {"lat": sample_lat, "lon": sample_lon, "max_km": 50}),
+    )
+
     print("\n=== Calling WindForecast(lat=55.66, lon=12.56, hours=5) ===")
-    wind_json = tools[0].func({"lat": sample_lat, "lon": sample_lon, "hours": 5})
     print(wind_json)
 
     print("\n=== Calling TideSeaLevel(lat=55.66, lon=12.56, hours=5) ===")
-    tide_json = tools[1].func({"lat": sample_lat, "lon": sample_lon, "hours": 5})
     print(tide_json)
 
     print("\n=== Calling FindSpots(lat=55.66, lon=12.56, max_km=50) ===")
-    spots_json = tools[2].func({"lat": sample_lat, "lon": sample_lon, "max_km": 50})
     print(spots_json)
 
 
 if __name__ == "__main__":
-    test_it()
\ No newline at end of file
+    asyncio.run(test_it())
\ No newline at end of file
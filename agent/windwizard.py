@@ -3,9 +3,11 @@ Simple demo agent that calls MCP tools to compute a stoke score
 and recommend gear based on current conditions.
 """
 
-from gradio_client import Client
+import asyncio
+import bisect
+
+import httpx
 import gradio as gr
-from statistics import mean
 
 # URLs where the tool servers run locally
 WEATHER_URL = "http://127.0.0.1:7860/"
@@ -14,47 +16,50 @@ SPOT_URL = "http://127.0.0.1:7862/"
 PROFILE_URL = "http://127.0.0.1:7863/"
 NOTIFY_URL = "http://127.0.0.1:7864/"
 
-weather_client = Client(WEATHER_URL)
-tide_client = Client(TIDE_URL)
-spot_client = Client(SPOT_URL)
-profile_client = Client(PROFILE_URL)
-notify_client = Client(NOTIFY_URL)
+# Kite size by average wind (kt): below 10, 10-15, 15-20, 20 and up
+_WIND_THRESHOLDS = (10.0, 15.0, 20.0)
+_KITE_LABELS = ("Too little wind", "12m kite", "9m kite", "7m kite")
+
+# One pooled keep-alive client shared by every tool call
+_HTTP = httpx.AsyncClient(
+    timeout=30,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
 
+async def _call(url: str, api_name: str, *data):
+    """POST `data` straight to a tool's REST endpoint and return its first output."""
+    r = await _HTTP.post(f"{url}gradio_api/run/{api_name}", json={"data": list(data)})
+    r.raise_for_status()
+    return r.json()["data"][0]
 
-def compute_stoke(user_id: str, lat: float, lon: float, hours: int = 6, alert: bool = False):
+
+async def compute_stoke(user_id: str, lat: float, lon: float, hours: int = 6, alert: bool = False):
     # Convert hours to integer to ensure proper slicing in tools
     hours = int(hours)
-    
-    # Fetch profile
-    profile = profile_client.predict(user_id, api_name="//Get Profile")
+
+    # Profile, weather and tide are independent, so fetch them concurrently
+    profile, weather, avg_tide = await asyncio.gather(
+        _call(PROFILE_URL, "get_profile", user_id),
+        _call(WEATHER_URL, "predict", lat, lon, hours),
+        _call(TIDE_URL, "tide_mean", lat, lon, hours),
+    )
     weight = profile.get("weight", 80)
     skill = profile.get("skill", "intermediate")
 
-    weather = weather_client.predict(lat, lon, hours)
     wind = weather["windspeed_10m"]
-    avg_wind = mean(wind)
-
-    tide = tide_client.predict(lat, lon, hours, api_name="/predict")
-    tide_level = tide["sea_level"]
-    avg_tide = mean(tide_level)
+    avg_wind = sum(wind) / len(wind)
 
     # naive stoke score formula
-    score = min(100, max(0, int(avg_wind * 4 + avg_tide * 10)))
+    score = max(0, min(100, int(avg_wind * 4 + avg_tide * 10)))
 
     # simple kite size recommendation
-    if avg_wind < 10:
-        kite = "Too little wind"
-    elif avg_wind < 15:
-        kite = "12m kite"
-    elif avg_wind < 20:
-        kite = "9m kite"
-    else:
-        kite = "7m kite"
+    kite = _KITE_LABELS[bisect.bisect_right(_WIND_THRESHOLDS, avg_wind)]
 
     msg = f"Avg wind {avg_wind:.1f} kt, tide {avg_tide:.2f}m. Stoke {score}/100. Use {kite}."
 
     if alert and score >= 60:
-        notify_client.predict(profile.get("phone", ""), msg, api_name="//Send SMS")
+        await _call(NOTIFY_URL, "send_sms", profile.get("phone", ""), msg)
 
     return {"profile": profile, "stoke": score, "kite": kite, "message": msg}
 
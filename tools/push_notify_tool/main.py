@@ -29,22 +29,24 @@ TWILIO_FROM = os.getenv("TWILIO_FROM_NUMBER")
 SENDGRID_KEY = os.getenv("SENDGRID_API_KEY")
 SENDGRID_FROM = os.getenv("SENDGRID_FROM_EMAIL")
 
+# Built once so every notification reuses the same connection pool
+_TWILIO = TwilioClient(TWILIO_SID, TWILIO_TOKEN) if TwilioClient and TWILIO_SID else None
+_SG = sendgrid.SendGridAPIClient(SENDGRID_KEY) if sendgrid and SENDGRID_KEY else None
+
 
 def send_sms(to_number: str, message: str) -> dict:
-    if not TwilioClient or not TWILIO_SID:
+    if _TWILIO is None:
         return {"error": "Twilio not configured"}
-    client = TwilioClient(TWILIO_SID, TWILIO_TOKEN)
-    sms = client.messages.create(body=message, from_=TWILIO_FROM, to=to_number)
+    sms = _TWILIO.messages.create(body=message, from_=TWILIO_FROM, to=to_number)
     return {"sid": sms.sid}
 
 
 def send_email(to_email: str, subject: str, message: str) -> dict:
-    if not sendgrid or not SENDGRID_KEY:
+    if _SG is None:
         return {"error": "SendGrid not configured"}
-    sg = sendgrid.SendGridAPIClient(SENDGRID_KEY)
     mail = Mail(from_email=SENDGRID_FROM, to_emails=to_email,
                 subject=subject, plain_text_content=message)
-    response = sg.send(mail)
+    response = _SG.send(mail)
     return {"status_code": response.status_code}
 
 with gr.Blocks() as demo:
@@ -64,4 +66,7 @@ with gr.Blocks() as demo:
         btn_e.click(send_email, [em, subj, body], out_e)
 
 if __name__ == "__main__":
-    demo.launch(share=True, mcp_server=True, show_error=True)
+    # Twilio/SendGrid are rate-limited upstream, so keep fewer sends in flight
+    demo.queue(default_concurrency_limit=4, max_size=64).launch(
+        share=True, mcp_server=True, show_error=True
+    )
@@ -1,22 +1,38 @@
 # tools/spot_db_tool/main.py
-import os, gradio as gr
-from supabase import create_client
+import os, httpx, gradio as gr
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
 
 SUPABASE_URL   = os.getenv("SUPABASE_URL")
 SUPABASE_ANON  = os.getenv("SUPABASE_ANON_KEY")
-sb = create_client(SUPABASE_URL, SUPABASE_ANON)
 
-def get_spots_near(lat: float, lon: float, max_km: int = 150):
+# Pre-bound PostgREST client; skips supabase-py's per-call query builder
+_HTTP = httpx.AsyncClient(
+    base_url=SUPABASE_URL,
+    headers={"apikey": SUPABASE_ANON, "Authorization": f"Bearer {SUPABASE_ANON}"},
+    http2=True,
+    timeout=5,
+)
+
+# Spots don't move, so nearby lookups can be served from memory for a while
+_CACHE = TTLCache(maxsize=256, ttl=1800)
+
+async def get_spots_near(lat: float, lon: float, max_km: int = 150):
     """Return spots within `max_km` of lat/lon, sorted by distance."""
+    key = (round(lat, 3), round(lon, 3), max_km)
+    data = _CACHE.get(key)
+    if data is not None:
+        return data
     params = {
         'p_lat': lat,
         'p_lon': lon,
         'p_max_km': max_km
     }
-    data = sb.rpc('get_spots_near', params).execute().data
+    r = await _HTTP.post("/rest/v1/rpc/get_spots_near", json=params)
+    r.raise_for_status()
+    data = _CACHE[key] = r.json()
     return data
 
 demo = gr.Interface(
@@ -26,4 +42,6 @@ demo = gr.Interface(
     title="SpotDBTool – nearby spots",
 )
 if __name__ == "__main__":
-    demo.launch(share=True, mcp_server=True, show_error=True)
+    demo.queue(default_concurrency_limit=10, max_size=64).launch(
+        share=True, mcp_server=True, show_error=True
+    )
@@ -15,25 +15,84 @@ get_tide_sea_level(lat: float, lon: float, hours: int = 48) -> dict
 get_tide_extremes(lat: float, lon: float, days: int = 3) -> list
     • days ∈ [1, 10]
     Returns: list of { "time": "...", "height": float, "type": "high"/"low" }
+    Derived from the (cached) hourly sea level, so it shares one upstream call.
     (On Stormglass 402, returns extremes from the synthetic sine wave.)
+
+get_tide_mean(lat: float, lon: float, hours: int = 6) -> float
+    • hours ∈ [1, 240]
+    Returns: mean sea level (m) over the next `hours`, from the same cache.
 """
 
 from __future__ import annotations
-import os, datetime as dt, requests, math
+import os, datetime as dt, requests, threading
+import numpy as np
 import gradio as gr
+import orjson
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
 
+try:
+    from numba import njit
+except Exception:
+    # Fall back to plain NumPy if numba is unavailable on this platform
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 load_dotenv()
 API_KEY = os.getenv("STORMGLASS_API_KEY")
 BASE_URL = "https://api.stormglass.io/v2/tide"
 
+# Keep-alive session so repeat calls skip the TCP+TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Sea level is informational and refreshed at most hourly upstream;
+# both the sea-level and extremes endpoints read through this cache
+_CACHE = TTLCache(maxsize=256, ttl=3600)
+
+
+def _cache_key(lat: float, lon: float, hours: int, hour: dt.datetime) -> tuple:
+    return round(lat, 2), round(lon, 2), hours, hour
+
+
+def _current_hour() -> dt.datetime:
+    """Current UTC time floored to the hour."""
+    return dt.datetime.now(dt.timezone.utc).replace(minute=0, second=0, microsecond=0)
+
 
 def _request(endpoint: str, params: dict):
     """Helper to call Stormglass; may raise HTTPError (402, 401, etc.)."""
     hdr = {"Authorization": API_KEY}
-    r = requests.get(f"{BASE_URL}/{endpoint}", params=params, headers=hdr, timeout=10)
+    r = _SESSION.get(f"{BASE_URL}/{endpoint}", params=params, headers=hdr, timeout=10)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
+
+
+@njit(cache=True, fastmath=True)
+def _sine_core(hours: int, seconds0: float) -> np.ndarray:
+    """Hourly sine-wave levels for `hours` samples starting `seconds0` after the epoch."""
+    seconds = seconds0 + np.arange(hours) * 3600.0
+    # Period ≈ 12.42 h = 12.42 * 3600 s
+    period = 12.42 * 3600
+    return np.sin(2 * np.pi * (seconds / period))  # amplitude ±1 m
+
+
+@njit(cache=True, fastmath=True)
+def _extrema_core(levels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Indices of interior local maxima/minima in `levels`, plus a high/low flag for each."""
+    # Compare every interior sample with both neighbours in one sweep
+    prev, cur, nxt = levels[:-2], levels[1:-1], levels[2:]
+    high = (cur >= prev) & (cur >= nxt)
+    low = ~high & (cur <= prev) & (cur <= nxt)
+    idx = np.nonzero(high | low)[0]
+    return idx + 1, high[idx]
+
+
+def _sine_levels(hours: int, start_dt: dt.datetime) -> np.ndarray:
+    """Hourly levels of the synthetic sine-wave tide, starting at `start_dt`."""
+    seconds0 = (start_dt - dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)).total_seconds()
+    return _sine_core(hours, seconds0)
 
 
 def _sine_wave_tide(hours: int, start_dt: dt.datetime) -> dict:
@@ -42,65 +101,58 @@ def _sine_wave_tide(hours: int, start_dt: dt.datetime) -> dict:
     - Amplitude = 1 m (peak ±1 m). Can be scaled later if desired.
     - phase aligned to the UNIX epoch (arbitrary zero point).
     """
-    times = []
-    levels = []
-    for h in range(hours):
-        t = start_dt + dt.timedelta(hours=h)
-        # Compute seconds since epoch
-        seconds = (t - dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)).total_seconds()
-        # Period ≈ 12.42 h = 12.42 * 3600 s
-        period = 12.42 * 3600
-        level = math.sin(2 * math.pi * (seconds / period))
-        times.append(t.isoformat())
-        levels.append(level)  # amplitude ±1 m
+    levels = _sine_levels(hours, start_dt).tolist()
+    times = [(start_dt + dt.timedelta(hours=h)).isoformat() for h in range(hours)]
     return {"time": times, "sea_level": levels}
 
 
-def get_tide_sea_level(lat: float, lon: float, hours: int = 48) -> dict:
+@cached(_CACHE, key=_cache_key, lock=threading.Lock())
+def _get_sea_level_cached(lat: float, lon: float, hours: int, hour: dt.datetime) -> dict:
     """
-    Hourly sea‐level (m) for the next `hours` (≤ 240).
-    Tries Stormglass; on HTTP 402, returns a synthetic sine wave tide.
+    Fetch hourly sea level from Stormglass, or the synthetic sine wave on HTTP 402.
+    `hour` (see _current_hour) anchors the window and keys the cache, so entries
+    are never served once the hour they start at has passed.
     """
-    assert 1 <= hours <= 240, "hours must be between 1 and 240"
-    now = dt.datetime.now(dt.timezone.utc)
-    end = now + dt.timedelta(hours=hours)
+    end = hour + dt.timedelta(hours=hours)
     params = {
         "lat": lat,
         "lng": lon,
-        "start": now.strftime("%Y-%m-%dT%H"),
+        "start": hour.strftime("%Y-%m-%dT%H"),
         "end": end.strftime("%Y-%m-%dT%H"),
     }
     try:
-        data = _request("sea-level/point", params)["data"]
+        data = _request("sea-level/point", params)["data"][:hours]
         return {
-            "time": [row["time"] for row in data][:hours],
-            "sea_level": [row["sg"] for row in data][:hours],  # sg = composite source
+            "time": [row["time"] for row in data],
+            "sea_level": [row["sg"] for row in data],  # sg = composite source
         }
     except requests.HTTPError as e:
         if e.response.status_code == 402:
             # Fall back to synthetic tide
-            return _sine_wave_tide(hours, now)
+            return _sine_wave_tide(hours, hour)
         else:
             raise
 
 
-def _find_synthetic_extremes(days: int, start_dt: dt.datetime) -> list[dict]:
+def get_tide_sea_level(lat: float, lon: float, hours: int = 48) -> dict:
+    """
+    Hourly sea‐level (m) for the next `hours` (≤ 240).
+    Tries Stormglass; on HTTP 402, returns a synthetic sine wave tide.
+    """
+    assert 1 <= hours <= 240, "hours must be between 1 and 240"
+    return _get_sea_level_cached(lat, lon, hours, _current_hour())
+
+
+def _find_extremes(times: list, levels: list) -> list[dict]:
     """
-    Given `days`, look 0..days*24 hours ahead, sample hourly, find local maxima/minima 
-    in that synthetic sine wave. Return a list of dicts:
+    Find local maxima/minima in an hourly sea-level series. Return a list of dicts:
     [{ "time": "...", "height": float, "type": "high" / "low" }, …]
     """
-    hours = days * 24
-    tide = _sine_wave_tide(hours + 1, start_dt)  # +1 to detect last peak
-    times = tide["time"]
-    levels = tide["sea_level"]
-    extremes = []
-    for i in range(1, len(levels) - 1):
-        if levels[i] >= levels[i - 1] and levels[i] >= levels[i + 1]:
-            extremes.append({"time": times[i], "height": levels[i], "type": "high"})
-        elif levels[i] <= levels[i - 1] and levels[i] <= levels[i + 1]:
-            extremes.append({"time": times[i], "height": levels[i], "type": "low"})
-    return extremes
+    idx, is_high = _extrema_core(np.asarray(levels, dtype=np.float64))
+    return [
+        {"time": times[i], "height": levels[i], "type": "high" if high else "low"}
+        for i, high in zip(idx, is_high)
+    ]
 
 
 def get_tide_extremes(lat: float, lon: float, days: int = 3) -> list[dict]:
@@ -109,20 +161,18 @@ def get_tide_extremes(lat: float, lon: float, days: int = 3) -> list[dict]:
     Tries Stormglass; on HTTP 402, returns synthetic sine‐wave extremes.
     """
     assert 1 <= days <= 10, "days must be 1–10"
-    now = dt.datetime.now(dt.timezone.utc)
-    end_date = (now + dt.timedelta(days=days)).strftime("%Y-%m-%d")
-    start_date = now.strftime("%Y-%m-%d")
-    params = {"lat": lat, "lng": lon, "start": start_date, "end": end_date}
-    try:
-        data = _request("extremes", params)["data"]
-        # Each `data` row has {"time": "...", "height": ..., "type": "high"/"low"}
-        return data
-    except requests.HTTPError as e:
-        if e.response.status_code == 402:
-            # Generate synthetic extremes
-            return _find_synthetic_extremes(days, now)
-        else:
-            raise
+    # +1 to detect last peak, capped at the 240 h Stormglass window
+    tide = _get_sea_level_cached(lat, lon, min(days * 24 + 1, 240), _current_hour())
+    return _find_extremes(tide["time"], tide["sea_level"])
+
+
+def get_tide_mean(lat: float, lon: float, hours: int = 6) -> float:
+    """
+    Mean sea‐level (m) over the next `hours` (≤ 240).
+    Same source as get_tide_sea_level, but returns a single number.
+    """
+    assert 1 <= hours <= 240, "hours must be between 1 and 240"
+    return float(np.mean(_get_sea_level_cached(lat, lon, hours, _current_hour())["sea_level"]))
 
 
 demo_sea = gr.Interface(
@@ -141,13 +191,24 @@ demo_extremes = gr.Interface(
     description=get_tide_extremes.__doc__,
 )
 
+demo_mean = gr.Interface(
+    fn=get_tide_mean,
+    inputs=[gr.Number(label="Lat"), gr.Number(label="Lon"), gr.Slider(1, 240, 6)],
+    outputs="number",
+    title="TideTool – Mean Sea Level",
+    description=get_tide_mean.__doc__,
+    api_name="tide_mean",
+)
+
 if __name__ == "__main__":
-    # Launch both interfaces under one MCP server
+    # Launch all interfaces under one MCP server
     with gr.Blocks() as app:
         gr.Markdown("## TideTool: sea‐level and extremes (uses Stormglass, then synthetic)")
         with gr.Tab("Sea Level"):
             demo_sea.render()
         with gr.Tab("Extremes"):
             demo_extremes.render()
+        with gr.Tab("Mean"):
+            demo_mean.render()
 
-    app.launch(share=True, mcp_server=True)
+    app.queue(default_concurrency_limit=10, max_size=64).launch(share=True, mcp_server=True)
@@ -1,28 +1,44 @@
 """UserProfileTool
 Simple profile store for kitesurfers.
 Exposes get_profile(user_id) and set_profile(user_id, profile_json).
-This is a naive in-memory store for demo purposes.
+Profiles live in a small SQLite database, one row per user.
 """
 
 import json
+import sqlite3
+import threading
 import gradio as gr
 from pathlib import Path
 
-STORE_PATH = Path("profiles.json")
+STORE_PATH = Path("profiles.db")
+LEGACY_PATH = Path("profiles.json")
 
-if STORE_PATH.exists():
-    profiles = json.loads(STORE_PATH.read_text())
-else:
-    profiles = {}
+_db = sqlite3.connect(STORE_PATH, check_same_thread=False)
+_db.execute("PRAGMA journal_mode=WAL")
+_db.execute("PRAGMA synchronous=NORMAL")
+_db.execute("CREATE TABLE IF NOT EXISTS profiles(user_id TEXT PRIMARY KEY, json TEXT)")
+_lock = threading.Lock()
+
+# One-off import of profiles saved by the old JSON-file store
+if LEGACY_PATH.exists() and not _db.execute("SELECT 1 FROM profiles LIMIT 1").fetchone():
+    with _db:
+        _db.executemany(
+            "INSERT OR REPLACE INTO profiles VALUES (?, ?)",
+            [(k, json.dumps(v)) for k, v in json.loads(LEGACY_PATH.read_text()).items()],
+        )
 
 def get_profile(user_id: str) -> dict:
     """Return stored profile or empty dict."""
-    return profiles.get(user_id, {})
+    with _lock:
+        row = _db.execute("SELECT json FROM profiles WHERE user_id=?", (user_id,)).fetchone()
+    return json.loads(row[0]) if row else {}
 
 def set_profile(user_id: str, profile: dict) -> dict:
     """Update profile and persist to disk."""
-    profiles[user_id] = profile
-    STORE_PATH.write_text(json.dumps(profiles))
+    with _lock, _db:
+        _db.execute(
+            "INSERT OR REPLACE INTO profiles VALUES (?, ?)", (user_id, json.dumps(profile))
+        )
     return {"status": "ok"}
 
 with gr.Blocks() as demo:
@@ -31,13 +47,15 @@ with gr.Blocks() as demo:
         inp = gr.Textbox(label="User ID")
         out = gr.JSON(label="Profile")
         btn = gr.Button("Get")
-        btn.click(get_profile, inp, out, api_name="/Get Profile")
+        btn.click(get_profile, inp, out, api_name="get_profile")
     with gr.Tab("Set Profile"):
         inp_id = gr.Textbox(label="User ID")
         inp_profile = gr.JSON(label="Profile JSON")
         out_save = gr.JSON(label="Result")
         btn_save = gr.Button("Save")
-        btn_save.click(set_profile, [inp_id, inp_profile], out_save, api_name="/Set Profile")
+        btn_save.click(set_profile, [inp_id, inp_profile], out_save, api_name="set_profile")
 
 if __name__ == "__main__":
-    demo.launch(server_port=7863, share=True, mcp_server=True, show_error=True)
+    demo.queue(default_concurrency_limit=10, max_size=64).launch(
+        server_port=7863, share=True, mcp_server=True, show_error=True
+    )
@@ -8,15 +8,38 @@ get_wind_forecast(lat: float, lon: float, hours: int = 48) -> dict
     • hours ∈ [1, 168]  (7 days max)
 Returns:
     { "time": [...], "windspeed_10m": [...], "winddirection_10m": [...] }
-All arrays are ISO-8601-aligned and truncated to `hours` length.
+All arrays are ISO-8601-aligned (UTC), start at the current hour and are
+truncated to `hours` length.
 """
 
 from __future__ import annotations
-import requests, datetime as dt
+import requests, datetime as dt, threading
+from urllib.parse import urlencode
 import gradio as gr
+import orjson
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache, cached
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Keep-alive session so repeat calls skip the TCP+TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Open-Meteo refreshes at most hourly; entries are keyed on the request URL
+_CACHE = TTLCache(maxsize=512, ttl=600)
+
+# Fixed forecast_days buckets, so requests for nearby `hours` share a URL
+_FORECAST_DAYS = (1, 2, 3, 7, 16)
+
+
+@cached(_CACHE, key=lambda url, day: (url, day), lock=threading.Lock())
+def _fetch_hourly(url: str, day: dt.date) -> dict:
+    """GET an Open-Meteo URL; `day` only keys the cache, as rows start at 00:00 UTC today."""
+    resp = _SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)["hourly"]
+
 
 def get_wind_forecast(
     lat: float,
@@ -35,20 +58,22 @@ def get_wind_forecast(
         Dictionary with 'time', 'windspeed_10m', 'winddirection_10m' lists.
     """
     assert 1 <= hours <= 168, "hours must be 1-168"
+    now = dt.datetime.now(dt.timezone.utc)
+    start = now.hour  # index of the current hour in today's UTC rows
     params = {
-        "latitude": lat,
-        "longitude": lon,
+        # ~1 km buckets; same coordinates + days -> same URL for every user
+        "latitude": round(lat, 2),
+        "longitude": round(lon, 2),
         "hourly": "windspeed_10m,winddirection_10m",
-        "timezone": "auto",
+        "forecast_days": next(d for d in _FORECAST_DAYS if d * 24 >= start + hours),
+        "timezone": "UTC",
     }
-    resp = requests.get(OPEN_METEO_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    hourly = resp.json()["hourly"]
+    url = f"{OPEN_METEO_URL}?{urlencode(sorted(params.items()))}"
+    hourly = _fetch_hourly(url, now.date())
 
     return {
-        "time": hourly["time"][:hours],
-        "windspeed_10m": hourly["windspeed_10m"][:hours],
-        "winddirection_10m": hourly["winddirection_10m"][:hours],
+        key: hourly[key][start:start + hours]
+        for key in ("time", "windspeed_10m", "winddirection_10m")
     }
 
 
@@ -62,8 +87,11 @@ demo = gr.Interface(
     outputs="json",
     title="WeatherTool – Wind Forecast",
     description=get_wind_forecast.__doc__,
+    api_name="predict",
 )
 
 if __name__ == "__main__":
     # share=True = public link for judges; mcp_server=True = exposes the tool
-    demo.launch(share=True, mcp_server=True, show_error=True)
\ No newline at end of file
+    demo.queue(default_concurrency_limit=10, max_size=64).launch(
+        share=True, mcp_server=True, show_error=True
+    )
\ No newline at end of file